@@ -11,64 +11,74 @@ Ou seja, se a linha a ser analisada contiver 2 '$' o primeiro será substituído
 e o segundo por '\)', para cada abertura e fechamento ele deve seguir essa substituição.
 """
 
+import re
 from pathlib import Path
 
+_DOLLAR_OR_NEWLINE_RE = re.compile(r"\$|\n")
+_DELIMITERS = (r"\(", r"\)")
+IO_BUFFER_SIZE = 1 << 20
+FLASHCARDS_FILEPATH = Path(__file__).parent / "data" / "flashcards.csv"
 
-def replace_dollar_signs(line: str) -> str:
+
+def replace_dollar_signs(text: str) -> str:
     """
     Substitui os caracteres '$' por '\\(' e '\\)' alternadamente.
     O primeiro '$' vira '\\(', o segundo vira '\\)', e assim por diante.
+    A alternância é reiniciada a cada quebra de linha.
 
     Args:
-        line (str): Linha extraída do arquivo csv
+        text (str): Conteúdo (uma ou mais linhas) extraído do arquivo csv
 
     Returns:
         str: Texto com as substituições realizadas
     """
-    result: list[str] = []
-    is_opening = True
-
-    for char in line:
-        if char != "$":
-            result.append(char)
-            continue
+    if "$" not in text:
+        return text
 
-        result.append(r"\(" if is_opening else r"\)")
-        is_opening = not is_opening
+    # Linhas lidas do arquivo terminam em '\n'; só a quebra final não
+    # reinicia a alternância, então ela fica fora do caminho por split
+    body = text.removesuffix("\n")
+    if "\n" not in body:
+        first, *rest = body.split("$")
+        return (
+            first
+            + "".join(_DELIMITERS[i & 1] + part for i, part in enumerate(rest))
+            + text[len(body) :]
+        )
 
-    return "".join(result)
+    index = 0
 
+    def substitute(match: re.Match[str]) -> str:
+        nonlocal index
+        if match.group() == "\n":
+            index = 0
+            return "\n"
 
-def valid_filepath(
-    filepath: Path = Path(__file__).parent / "data" / "flashcards.csv",
-) -> Path | None:
-    """
-    Valida o caminho do arquivo csv.
+        delimiter = _DELIMITERS[index & 1]
+        index += 1
+        return delimiter
 
-    Args:
-        filepath (str): Caminho do arquivo
-
-    Returns:
-        bool: Verdadeiro se o caminho for válido, senão falso
-    """
-    if not filepath.exists():
-        print(f"Error: File '{filepath}' not found.")
-        return None
-    return filepath
+    return _DOLLAR_OR_NEWLINE_RE.sub(substitute, text)
 
 
 def main() -> None:
-    if not (filepath := valid_filepath()):
-        raise ValueError(f'Caminho do arquivo csv inválido "{filepath}"')
-
-    content = filepath.read_text(encoding="utf-8")
-    lines = content.splitlines(keepends=True)
-
-    processed_lines = [replace_dollar_signs(line) for line in lines]
-    new_content = "".join(processed_lines)
-
+    filepath = FLASHCARDS_FILEPATH
     new_filepath = filepath.parent / "flashcards_new.csv"
-    new_filepath.write_text(new_content, encoding="utf-8")
+
+    try:
+        source = filepath.open(encoding="utf-8", newline="", buffering=IO_BUFFER_SIZE)
+    except FileNotFoundError:
+        print(f"Error: File '{filepath}' not found.")
+        raise ValueError(f'Caminho do arquivo csv inválido "{filepath}"') from None
+
+    with (
+        source,
+        new_filepath.open(
+            "w", encoding="utf-8", newline="", buffering=IO_BUFFER_SIZE
+        ) as target,
+    ):
+        for line in source:
+            target.write(replace_dollar_signs(line))
     print(f"File '{new_filepath}' processed successfully.")
 
 
@@ -1,26 +1,32 @@
 """Script para obter o preço atual do Bitcoin em USD."""
 
-from curl_cffi.requests.exceptions import CertificateVerifyError
+import requests
 
-import yfinance as yf
+CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/BTC-USD"
+HEADERS = {"User-Agent": "Mozilla/5.0"}
 
 
 def get_bitcoin_price() -> float | None:
-    """Fetch the current Bitcoin price in USD using yfinance.
+    """Fetch the current Bitcoin price in USD from Yahoo Finance's chart API.
 
     Returns:
         (float | None): The current Bitcoin price in USD, rounded to 2 decimal places.
     """
-    btc = yf.Ticker("BTC-USD")
-
     try:
-        price = btc.history(period="1d")["Close"].iloc[0]
-    except CertificateVerifyError as e:
+        response = requests.get(
+            CHART_URL,
+            params={"interval": "1d", "range": "1d"},
+            headers=HEADERS,
+            timeout=10,
+        )
+        response.raise_for_status()
+        price = response.json()["chart"]["result"][0]["meta"]["regularMarketPrice"]
+    except (requests.RequestException, KeyError, IndexError, TypeError) as e:
         print(e)
         return None
 
-    if isinstance(price, float):
-        return round(price, 2)
+    if isinstance(price, (int, float)):
+        return round(float(price), 2)
     return None
 
 
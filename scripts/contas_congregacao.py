@@ -1,7 +1,12 @@
+import glob
+import importlib.util
 import logging
+import os
+import re
 import shutil
+import tempfile
 import warnings
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -33,11 +38,23 @@ HEADER_ROW = 6
 MIN_COLUNAS = 6
 COLUNAS_ESPERADAS = ["Data", "Historico", "Documento", "Credito", "Debito", "Saldo"]
 FORMATO_DATA = "%d/%m/%y"
+REGEX_DATA = re.compile(r"\d{1,2}/\d{1,2}/\d{2}")
 MARCADORES_BRADESCO = ["Bradesco", "BRADESCO", "Banco Bradesco"]
+MARCADORES_BRADESCO_UPPER = tuple(m.upper() for m in MARCADORES_BRADESCO)
 PALAVRAS_IGNORAR = ["Saldo", "Extrato"]
+REGEX_PALAVRAS_IGNORAR = re.compile("|".join(map(re.escape, PALAVRAS_IGNORAR)))
+ASSINATURA_OLE2 = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+ASSINATURA_ZIP = b"PK\x03\x04"
+# Usa o leitor calamine (Rust) quando instalado; senão o padrão do pandas
+MOTOR_EXCEL = "calamine" if importlib.util.find_spec("python_calamine") else None
 SEPARADOR_CSV = ";"
 DECIMAL_CSV = ","
+TABELA_NUMERO_BR = str.maketrans({".": "", ",": "."})
+TABELA_MOEDA_BR = str.maketrans(",.", ".,")
 MAX_WORKERS = 4
+PASTA_CACHE = ".cache"
+VERSAO_CACHE = 1
+TAMANHO_BUFFER_CSV = 1 << 20
 
 # =============================================================================
 # CONSTANTES - CATEGORIZAÇÃO DE TRANSAÇÕES
@@ -51,6 +68,11 @@ CATEGORIAS_TRANSACOES = {
     "Recebimentos Especiais": ["Ted", "Receb Pagfor", "Doc"],
 }
 CATEGORIA_PADRAO = "Outros"
+TENDENCIAS = ("Baixa", "Estável", "Alta")
+PADROES_CATEGORIAS = [
+    (categoria, re.compile("|".join(map(re.escape, palavras)), re.IGNORECASE))
+    for categoria, palavras in CATEGORIAS_TRANSACOES.items()
+]
 
 # =============================================================================
 # CONSTANTES - DASHBOARD
@@ -93,12 +115,55 @@ def limpar_numero(val: Any) -> float:
         return 0.0
 
     try:
-        return float(val_str.replace(".", "").replace(",", "."))
+        return float(val_str.translate(TABELA_NUMERO_BR))
     except ValueError:
         logger.warning(f"Unable to convert value to float: {val_str}")
         return 0.0
 
 
+def _limpar_coluna_numerica(serie: pd.Series) -> pd.Series:
+    """
+    Versão vetorizada de `limpar_numero` para uma coluna inteira.
+
+    Args:
+        serie: Coluna com valores no formato brasileiro.
+
+    Returns:
+        Series float com 0.0 nos valores vazios ou inválidos.
+    """
+    texto = serie.astype(str).str.strip()
+    vazios = serie.isna() | texto.isin(["-", "", "nan"])
+
+    numeros = pd.to_numeric(
+        texto.str.replace(".", "", regex=False).str.replace(",", ".", regex=False),
+        errors="coerce",
+    )
+
+    for val_str in texto[numeros.isna() & ~vazios]:
+        logger.warning(f"Unable to convert value to float: {val_str}")
+
+    return numeros.fillna(0.0)
+
+
+def validar_nome_bradesco(caminho: Path) -> bool:
+    """
+    Verifica pelo nome se o arquivo parece ser um extrato do Bradesco.
+
+    Feito antes da leitura para não gastar tempo de parsing com outros arquivos.
+
+    Args:
+        caminho: Caminho do arquivo.
+
+    Returns:
+        True se o nome contém um marcador do Bradesco, False caso contrário.
+    """
+    nome_arquivo = caminho.name.upper()
+    if not any(marcador in nome_arquivo for marcador in MARCADORES_BRADESCO_UPPER):
+        logger.warning(f"File {caminho.name} doesn't appear to be a Bradesco file")
+        return False
+    return True
+
+
 def validar_arquivo_bradesco(df: pd.DataFrame, caminho: Path) -> bool:
     """
     Valida se o DataFrame corresponde a um extrato válido do Bradesco.
@@ -116,11 +181,6 @@ def validar_arquivo_bradesco(df: pd.DataFrame, caminho: Path) -> bool:
         )
         return False
 
-    nome_arquivo = caminho.name.upper()
-    if not any(marcador.upper() in nome_arquivo for marcador in MARCADORES_BRADESCO):
-        logger.warning(f"File {caminho.name} doesn't appear to be a Bradesco file")
-        return False
-
     if df.empty:
         logger.warning(f"File {caminho.name} is empty")
         return False
@@ -128,7 +188,7 @@ def validar_arquivo_bradesco(df: pd.DataFrame, caminho: Path) -> bool:
     return True
 
 
-def agrupar_linhas_quebradas(df: pd.DataFrame) -> list[pd.Series]:
+def agrupar_linhas_quebradas(df: pd.DataFrame) -> pd.DataFrame:
     """
     Agrupa linhas quebradas de transações em uma única linha.
 
@@ -139,33 +199,46 @@ def agrupar_linhas_quebradas(df: pd.DataFrame) -> list[pd.Series]:
         df: DataFrame com possíveis linhas quebradas.
 
     Returns:
-        Lista de Series, cada uma representando uma transação completa.
+        DataFrame com uma linha por transação completa.
     """
     df["TransactionID"] = df["Data"].notna().cumsum()
-    rows: list[pd.Series] = []
+    continuacao = df["Data"].isna()
+
+    extras = df.loc[continuacao, ["TransactionID", "Historico"]].dropna()
+    extras["Historico"] = extras["Historico"].astype("string")
+    extras = extras[~extras["Historico"].str.contains(REGEX_PALAVRAS_IGNORAR)]
+    extras_por_transacao = extras.groupby("TransactionID")["Historico"].agg(" ".join)
+
+    principais = df[~continuacao].copy()
+    complemento = principais["TransactionID"].map(extras_por_transacao)
+    tem_complemento = complemento.notna()
+    principais.loc[tem_complemento, "Historico"] = (
+        principais.loc[tem_complemento, "Historico"].astype("string").fillna("")
+        + " "
+        + complemento[tem_complemento]
+    ).str.lstrip()
 
-    for _, group in df.groupby("TransactionID"):
-        if len(group) == 0:
-            continue
+    return principais
 
-        main_row = group.iloc[0].copy()
 
-        if len(group) > 1:
-            extras = group.iloc[1:]["Historico"].dropna().astype(str).tolist()
-            if extras:
-                extras_limpos = [
-                    x
-                    for x in extras
-                    if not any(palavra in x for palavra in PALAVRAS_IGNORAR)
-                ]
-                if extras_limpos:
-                    main_row["Historico"] = (
-                        str(main_row["Historico"]) + " " + " ".join(extras_limpos)
-                    )
+def _detectar_formato(caminho: Path) -> str:
+    """
+    Identifica o formato real do arquivo pela assinatura dos primeiros bytes.
+
+    Extratos "XLS" do Bradesco costumam ser HTML com extensão .xls.
+
+    Args:
+        caminho: Caminho do arquivo.
 
-        rows.append(main_row)
+    Returns:
+        'excel' para OLE2 (XLS) ou ZIP (XLSX), 'html' caso contrário.
+    """
+    with caminho.open("rb") as arquivo:
+        cabecalho = arquivo.read(len(ASSINATURA_OLE2))
 
-    return rows
+    if cabecalho.startswith((ASSINATURA_OLE2, ASSINATURA_ZIP)):
+        return "excel"
+    return "html"
 
 
 def processar_arquivo_bradesco(caminho_arquivo: Path) -> pd.DataFrame | None:
@@ -181,19 +254,22 @@ def processar_arquivo_bradesco(caminho_arquivo: Path) -> pd.DataFrame | None:
     nome_arq = caminho_arquivo.name
     logger.debug(f"Processing file: {nome_arq}")
 
-    df: pd.DataFrame | None = None
+    if not validar_nome_bradesco(caminho_arquivo):
+        return None
 
     try:
-        df = pd.read_excel(caminho_arquivo, header=HEADER_ROW)
-    except (ValueError, FileNotFoundError) as e:
-        logger.debug(f"Failed to read {nome_arq} as Excel: {e}")
-        try:
-            df = pd.read_html(str(caminho_arquivo), header=HEADER_ROW)[0]
-        except (ValueError, IndexError) as e:
-            logger.error(f"Failed to read file {nome_arq}: {e}")
-            return None
-
-    if df is None:
+        if _detectar_formato(caminho_arquivo) == "html":
+            df = pd.read_html(str(caminho_arquivo), header=HEADER_ROW, flavor="lxml")[0]
+        else:
+            df = pd.read_excel(
+                caminho_arquivo,
+                header=HEADER_ROW,
+                usecols=list(range(MIN_COLUNAS)),
+                names=COLUNAS_ESPERADAS,
+                engine=MOTOR_EXCEL,
+            )
+    except (ValueError, IndexError, OSError) as e:
+        logger.error(f"Failed to read file {nome_arq}: {e}")
         return None
 
     if not validar_arquivo_bradesco(df, caminho_arquivo):
@@ -202,15 +278,24 @@ def processar_arquivo_bradesco(caminho_arquivo: Path) -> pd.DataFrame | None:
     df = df.iloc[:, :MIN_COLUNAS]
     df.columns = COLUNAS_ESPERADAS
 
-    df = df[df["Data"] != "Data"]
-    df = df.dropna(subset=["Data", "Historico"], how="all")
+    # Remove cabeçalhos repetidos e linhas vazias com uma única máscara
+    nao_cabecalho = df["Data"].ne("Data")
+    nao_vazia = df[["Data", "Historico"]].notna().any(axis=1)
+    df = df.iloc[(nao_cabecalho & nao_vazia).to_numpy()].copy()
+    df["Historico"] = df["Historico"].astype("string")
 
-    rows = agrupar_linhas_quebradas(df)
+    df_clean = agrupar_linhas_quebradas(df)
 
-    df_clean = pd.DataFrame(rows)
+    if pd.api.types.is_object_dtype(df_clean["Data"]):
+        # Descarta textos fora do formato antes do parser; objetos de data seguem.
+        # A máscara olha só células str: uma coluna só de datas não tem .str
+        datas = df_clean["Data"]
+        e_texto = datas.map(type).eq(str)
+        no_formato = datas.where(e_texto, "").astype(str).str.fullmatch(REGEX_DATA)
+        df_clean = df_clean[~(e_texto & ~no_formato)]
 
     df_clean["Data"] = pd.to_datetime(
-        df_clean["Data"], format=FORMATO_DATA, errors="coerce"
+        df_clean["Data"], format=FORMATO_DATA, errors="coerce", cache=True
     )
     df_clean = df_clean.dropna(subset=["Data"])
 
@@ -219,10 +304,15 @@ def processar_arquivo_bradesco(caminho_arquivo: Path) -> pd.DataFrame | None:
         return None
 
     for col in ["Credito", "Debito", "Saldo"]:
-        df_clean[col] = df_clean[col].apply(limpar_numero)
+        df_clean[col] = _limpar_coluna_numerica(df_clean[col])
 
-    df_clean["Valor"] = df_clean["Credito"] + df_clean["Debito"]
-    df_clean["Arquivo_Origem"] = nome_arq
+    df_clean["Valor"] = np.add(
+        df_clean["Credito"].to_numpy(), df_clean["Debito"].to_numpy()
+    )
+    # Um único código repetido: sem lista de strings nem hash por linha
+    df_clean["Arquivo_Origem"] = pd.Categorical.from_codes(
+        np.zeros(len(df_clean), dtype=np.int8), [nome_arq]
+    )
 
     logger.debug(f"Successfully processed {nome_arq}: {len(df_clean)} transactions")
     return df_clean
@@ -238,15 +328,19 @@ def recalcular_saldo(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame com coluna Saldo recalculada.
     """
-    saldo_inicial = 0.0
-    primeira_linha_com_saldo = df[df["Saldo"] != 0].head(1)
-
-    if not primeira_linha_com_saldo.empty:
-        saldo_linha = primeira_linha_com_saldo["Saldo"].values[0]
-        valor_linha = primeira_linha_com_saldo["Valor"].values[0]
-        saldo_inicial = saldo_linha - valor_linha
+    saldos = df["Saldo"].to_numpy()
+    valores = df["Valor"].to_numpy()
 
-    df["Saldo"] = (saldo_inicial + df["Valor"].cumsum()).round(2)
+    saldo_inicial = 0.0
+    com_saldo = saldos != 0
+    if com_saldo.any():
+        i = com_saldo.argmax()
+        saldo_inicial = saldos[i] - valores[i]
+
+    # Operações in-place no mesmo buffer evitam arrays temporários
+    saldo = np.cumsum(valores, dtype=np.float64)
+    saldo += saldo_inicial
+    df["Saldo"] = np.round(saldo, 2, out=saldo)
     return df
 
 
@@ -260,24 +354,109 @@ def consolidar_extratos(dataframes: list[pd.DataFrame]) -> pd.DataFrame:
     Returns:
         DataFrame consolidado e ordenado cronologicamente.
     """
-    df_final = pd.concat(dataframes, ignore_index=True)
-
-    df_final = df_final.drop_duplicates(
-        subset=["Data", "Historico", "Documento", "Valor"], keep="first"
+    # Categorias diferentes por arquivo viram object no concat; unir os
+    # categóricos só junta as categorias e remapeia os códigos
+    origens = pd.api.types.union_categoricals(
+        [pd.Categorical(df["Arquivo_Origem"]) for df in dataframes]
     )
+    df_final = pd.concat(dataframes, ignore_index=True, copy=False)
+    df_final["Arquivo_Origem"] = origens
+
+    # Chave de duplicidade só com colunas numéricas para usar o hash rápido
+    historico_codes, _ = pd.factorize(df_final["Historico"])
+    documento_codes, _ = pd.factorize(df_final["Documento"])
+    chave = pd.DataFrame(
+        {
+            "Data": df_final["Data"].to_numpy().view("i8"),
+            "Historico": historico_codes,
+            "Documento": documento_codes,
+            "Valor": df_final["Valor"].to_numpy(),
+        }
+    )
+    df_final = df_final[~chave.duplicated(keep="first").to_numpy()]
 
-    df_final["Ordem_Tipo"] = np.where(df_final["Valor"] >= 0, 0, 1)
-    df_final = df_final.sort_values(by=["Data", "Ordem_Tipo"], ascending=[True, True])
-    df_final = df_final.drop(columns=["Ordem_Tipo"])
+    # Ordena por data e, no mesmo dia, créditos antes de débitos.
+    # np.lexsort usa a última chave como primária e é estável.
+    ordem = np.lexsort(
+        (df_final["Valor"].to_numpy() < 0, df_final["Data"].to_numpy().view("i8"))
+    )
+    df_final = df_final.iloc[ordem]
 
     df_final = recalcular_saldo(df_final)
 
     return df_final
 
 
+def _caminho_cache(caminho_arquivo: Path) -> Path:
+    """Monta o caminho do cache a partir do nome, mtime e tamanho do arquivo."""
+    info = caminho_arquivo.stat()
+    chave = f"v{VERSAO_CACHE}_{info.st_mtime_ns}_{info.st_size}"
+    return caminho_arquivo.parent / PASTA_CACHE / f"{caminho_arquivo.name}.{chave}.pkl"
+
+
+def processar_arquivo_com_cache(caminho_arquivo: Path) -> pd.DataFrame | None:
+    """
+    Processa um arquivo reaproveitando o resultado salvo se ele não mudou.
+
+    Args:
+        caminho_arquivo: Caminho para o arquivo XLS/XLSX.
+
+    Returns:
+        DataFrame processado ou None se inválido.
+    """
+    cache = _caminho_cache(caminho_arquivo)
+
+    try:
+        df = pd.read_pickle(cache)
+        logger.debug(f"Using cached result for {caminho_arquivo.name}")
+        return df
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        # Pickle truncado ou de outra versão do pandas: descarta e reprocessa
+        logger.warning(f"Discarding unreadable cache {cache.name}: {e}")
+        cache.unlink(missing_ok=True)
+
+    df = processar_arquivo_bradesco(caminho_arquivo)
+    if df is None:
+        return None
+
+    cache.parent.mkdir(exist_ok=True)
+    # Só entradas deste arquivo ("<nome>.v<versão>_<mtime>_<tamanho>.pkl")
+    entrada = re.compile(rf"{re.escape(caminho_arquivo.name)}\.v\d+_\d+_\d+\.pkl")
+    for antigo in cache.parent.glob(f"{glob.escape(caminho_arquivo.name)}.v*.pkl"):
+        if antigo != cache and entrada.fullmatch(antigo.name):
+            antigo.unlink(missing_ok=True)
+
+    # Grava em arquivo temporário e troca atomicamente: uma falha no meio da
+    # escrita nunca deixa um pickle truncado no caminho final
+    descritor, temporario = tempfile.mkstemp(dir=cache.parent, suffix=".tmp")
+    os.close(descritor)
+    try:
+        df.to_pickle(temporario)
+        Path(temporario).replace(cache)
+    except BaseException:
+        Path(temporario).unlink(missing_ok=True)
+        raise
+
+    return df
+
+
+def _processar_arquivo_seguro(caminho_arquivo: Path) -> pd.DataFrame | None:
+    """Executa `processar_arquivo_com_cache` registrando erros em vez de propagá-los."""
+    try:
+        return processar_arquivo_com_cache(caminho_arquivo)
+    except Exception as e:
+        logger.error(f"Error processing {caminho_arquivo.name}: {e}")
+        return None
+
+
 def processar_arquivos_paralelo(arquivos: list[Path]) -> list[pd.DataFrame]:
     """
-    Processa múltiplos arquivos em paralelo usando ProcessPoolExecutor.
+    Processa múltiplos arquivos em paralelo usando ThreadPoolExecutor.
+
+    Os parsers do pandas (lxml/xlrd/openpyxl) fazem o trabalho pesado em C, e
+    threads evitam o custo de iniciar processos e serializar os DataFrames.
 
     Args:
         arquivos: Lista de caminhos para arquivos XLS.
@@ -287,19 +466,10 @@ def processar_arquivos_paralelo(arquivos: list[Path]) -> list[pd.DataFrame]:
     """
     resultados: list[pd.DataFrame] = []
 
-    with ProcessPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        futures = {
-            executor.submit(processar_arquivo_bradesco, arq): arq for arq in arquivos
-        }
-
-        for future in as_completed(futures):
-            arquivo = futures[future]
-            try:
-                resultado = future.result()
-                if resultado is not None and not resultado.empty:
-                    resultados.append(resultado)
-            except Exception as e:
-                logger.error(f"Error processing {arquivo.name}: {e}")
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for resultado in executor.map(_processar_arquivo_seguro, arquivos):
+            if resultado is not None and not resultado.empty:
+                resultados.append(resultado)
 
     return resultados
 
@@ -349,85 +519,135 @@ def processar_extratos() -> pd.DataFrame | None:
 # =============================================================================
 def categorizar_transacao(historico: str) -> str:
     """Categoriza uma transação baseado no campo Historico."""
-    historico_upper = str(historico).upper()
-    for categoria, palavras_chave in CATEGORIAS_TRANSACOES.items():
-        for palavra in palavras_chave:
-            if palavra.upper() in historico_upper:
-                return categoria
+    texto = str(historico)
+    for categoria, padrao in PADROES_CATEGORIAS:
+        if padrao.search(texto):
+            return categoria
     return CATEGORIA_PADRAO
 
 
+def categorizar_transacoes(historicos: pd.Series) -> pd.Series:
+    """Versão vetorizada de `categorizar_transacao`, devolvida como Categorical."""
+    texto = historicos.astype(str)
+    condicoes = [texto.str.contains(padrao) for _, padrao in PADROES_CATEGORIAS]
+    categorias = [categoria for categoria, _ in PADROES_CATEGORIAS]
+    codigos = np.select(
+        condicoes, np.arange(len(categorias), dtype=np.int8), default=len(categorias)
+    )
+    return pd.Series(
+        pd.Categorical.from_codes(codigos, categories=[*categorias, CATEGORIA_PADRAO]),
+        index=historicos.index,
+    )
+
+
 def calcular_tendencia(valores: pd.Series) -> str:
     """Calcula tendência via regressão linear: 'Alta', 'Baixa' ou 'Estável'."""
     if len(valores) < 3:
         return "Estável"
 
-    x = np.arange(len(valores))
-    y = np.array(valores.values, dtype=float)
+    y = np.asarray(valores, dtype=np.float64)
+    n = y.size
+    x = np.arange(n, dtype=np.float64)
 
-    slope, _ = np.polyfit(x, y, 1)
+    # Inclinação de mínimos quadrados em forma fechada: com x = 0..n-1,
+    # Σx e Σ(x - x̄)² são conhecidos e só Σy e Σxy dependem dos dados.
+    soma_x = n * (n - 1) / 2
+    soma_xx_centrada = n * (n * n - 1) / 12
+    slope = (float(x @ y) - soma_x * float(y.sum()) / n) / soma_xx_centrada
 
     std_y = float(np.std(y))
     threshold = std_y * 0.1 if std_y > 0 else 0.01
 
-    if slope > threshold:
-        return "Alta"
-    elif slope < -threshold:
-        return "Baixa"
-    return "Estável"
+    # -1, 0 ou 1 sem ramificações (NaN cai em 0, 'Estável')
+    sinal = int(slope > threshold) - int(slope < -threshold)
+    return TENDENCIAS[sinal + 1]
 
 
-def adicionar_moving_averages(df: pd.DataFrame) -> pd.DataFrame:
-    """Adiciona médias móveis de 3 meses ao DataFrame."""
-    df = df.copy()
+def calcular_resumo_mensal(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Agrega o DataFrame por mês uma única vez para todas as análises mensais.
 
-    mensal = df.groupby("AnoMes").agg({"Saldo": "last", "Valor": "sum"}).reset_index()
-    mensal["MA3_Saldo"] = mensal["Saldo"].rolling(window=3, min_periods=1).mean()
-    mensal["MA3_Fluxo"] = mensal["Valor"].rolling(window=3, min_periods=1).mean()
+    Args:
+        df: DataFrame com 'AnoMes', 'Saldo' e 'Valor' ('Debito_Abs' opcional).
 
-    mensal["Tendencia"] = calcular_tendencia(mensal["Saldo"])
+    Returns:
+        DataFrame indexado por 'AnoMes' em ordem cronológica, com saldo final,
+        fluxo líquido, total de débitos, médias móveis de 3 meses e
+        crescimento mês a mês (%).
+    """
+    agregacoes = {"Saldo": "last", "Valor": "sum"}
+    if "Debito_Abs" in df.columns:
+        agregacoes["Debito_Abs"] = "sum"
+    mensal = df.groupby("AnoMes", observed=True).agg(agregacoes)
+    medias = mensal[["Saldo", "Valor"]].rolling(window=3, min_periods=1).mean()
+    mensal["MA3_Saldo"] = medias["Saldo"].round(2)
+    mensal["MA3_Fluxo"] = medias["Valor"].round(2)
+    mensal["MoM_Growth"] = mensal["Valor"].pct_change() * 100
+    return mensal
 
-    ma_map = mensal.set_index("AnoMes")[
-        ["MA3_Saldo", "MA3_Fluxo", "Tendencia"]
-    ].to_dict()
-    df["MA3_Saldo"] = df["AnoMes"].map(ma_map["MA3_Saldo"]).round(2)
-    df["MA3_Fluxo"] = df["AnoMes"].map(ma_map["MA3_Fluxo"]).round(2)
-    df["Tendencia"] = df["AnoMes"].map(ma_map["Tendencia"])
 
-    return df
+def adicionar_moving_averages(
+    df: pd.DataFrame, mensal: pd.DataFrame | None = None
+) -> pd.DataFrame:
+    """
+    Adiciona médias móveis de 3 meses ao DataFrame.
 
+    O join já devolve um novo DataFrame, então a entrada não é copiada.
+    Aceita o resumo de `calcular_resumo_mensal` para não reagrupar por mês.
+    """
+    if mensal is None:
+        mensal = calcular_resumo_mensal(df)
 
-def detectar_anomalias(df: pd.DataFrame, threshold: float = 2.0) -> pd.DataFrame:
-    """Detecta transações anômalas usando Z-Score por categoria."""
-    df = df.copy()
-    df["Anomalia"] = "Normal"
+    colunas = mensal[["MA3_Saldo", "MA3_Fluxo"]].assign(
+        Tendencia=calcular_tendencia(mensal["Saldo"])
+    )
+    # Um único join preserva o índice original e escreve as três colunas
+    return df.join(colunas, on="AnoMes")
 
-    for categoria in df["Categoria"].unique():
-        cat_mask = df["Categoria"] == categoria
-        cat_indices = df[cat_mask].index.tolist()
 
-        if len(cat_indices) < 3:
-            continue
+def detectar_anomalias(df: pd.DataFrame, threshold: float = 2.0) -> pd.DataFrame:
+    """
+    Detecta transações anômalas usando Z-Score por categoria.
 
-        valores = df.loc[cat_indices, "Valor"].abs().astype(float)
-        mean_val = valores.mean()
-        std_val = valores.std()
+    Escreve a coluna 'Anomalia' no próprio DataFrame recebido; quem chama
+    deve ser dono do frame (ver preparar_dados_dashboard, que copia uma vez).
+    """
+    valores_abs = df["Valor"].abs().astype(float)
+    grupos = valores_abs.groupby(df["Categoria"], observed=True)
+    media = grupos.transform("mean")
+    desvio = grupos.transform("std")
+    tamanho = grupos.transform("size")
+
+    z_score = (valores_abs - media).abs() / desvio
+    anomalia = (tamanho >= 3) & (desvio > 0) & (z_score > threshold)
+    df["Anomalia"] = pd.Categorical.from_codes(
+        anomalia.to_numpy().astype(np.int8), categories=["Normal", "Anomalia"]
+    )
 
-        if std_val == 0:
-            continue
+    return df
 
-        for idx in cat_indices:
-            z_score = abs((abs(df.loc[idx, "Valor"]) - mean_val) / std_val)
-            if z_score > threshold:
-                df.loc[idx, "Anomalia"] = "Anomalia"
 
-    return df
+def calcular_totais(df: pd.DataFrame) -> dict[str, float]:
+    """Soma créditos e débitos em uma passada e lê o saldo final."""
+    totais = df[["Credito_Abs", "Debito_Abs"]].sum()
+    return {
+        "saldo_atual": float(df["Saldo"].iloc[-1]) if not df.empty else 0.0,
+        "total_creditos": float(totais["Credito_Abs"]),
+        "total_debitos": float(totais["Debito_Abs"]),
+    }
 
 
-def calcular_metricas_avancadas(df: pd.DataFrame) -> dict[str, float]:
+def calcular_metricas_avancadas(
+    df: pd.DataFrame,
+    mensal: pd.DataFrame | None = None,
+    totais: dict[str, float] | None = None,
+) -> dict[str, float]:
     """
     Calcula métricas financeiras avançadas.
 
+    Aceita o resumo de `calcular_resumo_mensal` e os totais de
+    `calcular_totais` para não reagrupar nem somar de novo.
+
     Retorna:
         savings_rate: Taxa de poupança (%)
         burn_rate: Taxa média mensal de gastos
@@ -436,22 +656,28 @@ def calcular_metricas_avancadas(df: pd.DataFrame) -> dict[str, float]:
         income_expense_ratio: Razão receitas/despesas
         volatilidade: Volatilidade do fluxo mensal (%)
     """
-    total_creditos = df["Credito_Abs"].sum()
-    total_debitos = df["Debito_Abs"].sum()
-    saldo_atual = df["Saldo"].iloc[-1] if not df.empty else 0.0
+    if totais is None:
+        totais = calcular_totais(df)
+    total_creditos = totais["total_creditos"]
+    total_debitos = totais["total_debitos"]
+    saldo_atual = totais["saldo_atual"]
 
     savings_rate = 0.0
     if total_creditos > 0:
         savings_rate = ((total_creditos - total_debitos) / total_creditos) * 100
 
-    fluxo_mensal = df.groupby("AnoMes")["Debito_Abs"].sum()
+    # Uma única agregação mensal para burn rate e volatilidade
+    if mensal is None:
+        mensal = calcular_resumo_mensal(df)
+    fluxo_mensal = mensal["Debito_Abs"]
     burn_rate = fluxo_mensal.mean() if len(fluxo_mensal) > 0 else 0.0
 
     runway_meses = 999.0
     if burn_rate > 0:
         runway_meses = min(saldo_atual / burn_rate, 999.0)
 
-    num_dias = (df["Data"].max() - df["Data"].min()).days + 1 if len(df) > 1 else 1
+    data_min, data_max = df["Data"].min(), df["Data"].max()
+    num_dias = (data_max - data_min).days + 1 if len(df) > 1 else 1
     dias_caixa = 999.0
     taxa_diaria = total_debitos / num_dias if num_dias > 0 else 0.0
     if taxa_diaria > 0:
@@ -461,7 +687,7 @@ def calcular_metricas_avancadas(df: pd.DataFrame) -> dict[str, float]:
     if total_debitos > 0:
         income_expense_ratio = total_creditos / total_debitos
 
-    fluxo_liquido_mensal = df.groupby("AnoMes")["Valor"].sum()
+    fluxo_liquido_mensal = mensal["Valor"]
     volatilidade = 0.0
     if len(fluxo_liquido_mensal) > 1 and fluxo_liquido_mensal.mean() != 0:
         volatilidade = (
@@ -478,31 +704,86 @@ def calcular_metricas_avancadas(df: pd.DataFrame) -> dict[str, float]:
     }
 
 
-def preparar_dados_dashboard(df: pd.DataFrame) -> pd.DataFrame:
+def _expandir_meses(
+    meses: pd.PeriodIndex, codigos: np.ndarray, formato: str
+) -> pd.Categorical:
+    """Formata cada mês distinto uma única vez e usa os códigos da linha."""
+    return pd.Categorical.from_codes(codigos, categories=meses.strftime(formato))
+
+
+def calcular_resumo_dashboard(
+    df: pd.DataFrame, mensal: pd.DataFrame | None = None
+) -> dict[str, Any]:
     """
-    Adiciona colunas calculadas necessárias para o dashboard.
+    Calcula uma única vez os KPIs compartilhados pelas páginas do dashboard.
+
+    Args:
+        df: DataFrame preparado por `preparar_dados_dashboard`.
+        mensal: Resumo de `calcular_resumo_mensal`, se já calculado.
+
+    Returns:
+        Dicionário com saldo atual, totais, nº de transações e métricas avançadas.
+    """
+    totais = calcular_totais(df)
+    return {
+        **totais,
+        "num_transacoes": len(df),
+        "metricas": calcular_metricas_avancadas(df, mensal, totais),
+    }
+
+
+def preparar_dados_dashboard_e_resumo_mensal(
+    df: pd.DataFrame,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Adiciona as colunas do dashboard e devolve também o resumo mensal.
+
+    O resumo de `calcular_resumo_mensal` é montado uma única vez aqui e
+    reaproveitado pelas médias móveis, pelas métricas e pelas páginas.
 
     Args:
         df: DataFrame consolidado dos extratos.
 
     Returns:
-        DataFrame com colunas adicionais para análise.
+        Tupla (DataFrame com colunas adicionais, resumo mensal).
     """
-    df = df.copy()
+    # Cópia rasa: as colunas novas ou substituídas não tocam o frame original
+    df = df.copy(deep=False)
     df["Data"] = pd.to_datetime(df["Data"])
     df["Ano"] = df["Data"].dt.year
     df["Mes"] = df["Data"].dt.month
-    df["AnoMes"] = df["Data"].dt.strftime("%Y-%m")
-    df["MesNome"] = df["Data"].dt.strftime("%b/%Y")
-    df["Tipo"] = df["Valor"].apply(lambda x: "Crédito" if x >= 0 else "Débito")
-    df["Credito_Abs"] = df["Credito"].abs()
-    df["Debito_Abs"] = df["Debito"].abs()
-    df["Categoria"] = df["Historico"].apply(categorizar_transacao)
-
-    df = adicionar_moving_averages(df)
+    # Formata só os meses distintos e expande pelos códigos de cada linha
+    # sort=True deixa as categorias em ordem cronológica para os groupbys
+    codigos, meses = pd.factorize(df["Data"].dt.to_period("M"), sort=True)
+    df["AnoMes"] = _expandir_meses(meses, codigos, "%Y-%m")
+    df["MesNome"] = _expandir_meses(meses, codigos, "%b/%Y")
+    df["Tipo"] = pd.Categorical.from_codes(
+        (~(df["Valor"].to_numpy() >= 0)).astype(np.int8),
+        categories=["Crédito", "Débito"],
+    )
+    df["Credito_Abs"] = np.abs(df["Credito"].to_numpy())
+    df["Debito_Abs"] = np.abs(df["Debito"].to_numpy())
+    df["Categoria"] = categorizar_transacoes(df["Historico"])
+
+    mensal = calcular_resumo_mensal(df)
+    df = adicionar_moving_averages(df, mensal)
+    df["Tendencia"] = df["Tendencia"].astype("category")
     df = detectar_anomalias(df)
 
-    return df
+    return df, mensal
+
+
+def preparar_dados_dashboard(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Adiciona colunas calculadas necessárias para o dashboard.
+
+    Args:
+        df: DataFrame consolidado dos extratos.
+
+    Returns:
+        DataFrame com colunas adicionais para análise.
+    """
+    return preparar_dados_dashboard_e_resumo_mensal(df)[0]
 
 
 def _fix_chart_aggregation(dashboard_path: Path) -> None:
@@ -512,35 +793,26 @@ def _fix_chart_aggregation(dashboard_path: Path) -> None:
     A biblioteca powerbpy usa Function: 0 (Sum) por padrão, mas para gráficos
     como 'Evolução do Saldo', precisamos de Function: 1 (Average).
     """
-    for visual_dir in dashboard_path.rglob("visuals"):
-        for chart_dir in visual_dir.iterdir():
-            if not chart_dir.is_dir():
-                continue
-
-            if "evolucao_saldo" not in chart_dir.name:
-                continue
-
-            visual_file = chart_dir / "visual.json"
-            if not visual_file.exists():
-                continue
-
-            try:
-                content = visual_file.read_text(encoding="utf-8")
-                content_modified = content.replace('"Function": 0', '"Function": 1')
-                if content_modified != content:
-                    visual_file.write_text(content_modified, encoding="utf-8")
-                    logger.info(f"Fixed aggregation to Average in {chart_dir.name}")
-            except OSError as e:
-                logger.warning(f"Failed to fix aggregation in {visual_file}: {e}")
+    for visual_file in dashboard_path.rglob("visuals/*evolucao_saldo*/visual.json"):
+        try:
+            content = visual_file.read_text(encoding="utf-8")
+            content_modified = content.replace('"Function": 0', '"Function": 1')
+            if content_modified != content:
+                visual_file.write_text(content_modified, encoding="utf-8")
+                logger.info(
+                    f"Fixed aggregation to Average in {visual_file.parent.name}"
+                )
+        except OSError as e:
+            logger.warning(f"Failed to fix aggregation in {visual_file}: {e}")
 
 
 def _formatar_brl(valor: float) -> str:
     """Formata valor monetário no padrão brasileiro (R$ 1.234,56)."""
-    return f"R$ {valor:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+    return f"R$ {valor:,.2f}".translate(TABELA_MOEDA_BR)
 
 
 def criar_pagina_visao_geral(
-    dashboard: Any, data_source: str, df: pd.DataFrame
+    dashboard: Any, data_source: str, resumo: dict[str, Any]
 ) -> None:
     """
     Cria a página de Visão Geral com KPIs e gráficos principais.
@@ -548,17 +820,17 @@ def criar_pagina_visao_geral(
     Args:
         dashboard: Instância do Dashboard powerbpy.
         data_source: Nome do dataset no dashboard.
-        df: DataFrame com os dados para calcular KPIs.
+        resumo: KPIs pré-calculados por `calcular_resumo_dashboard`.
     """
     page = dashboard.new_page(page_name="Visão Geral")
 
     cards_y = 20
     card_spacing = 20
 
-    saldo_atual = df["Saldo"].iloc[-1] if not df.empty else 0.0
-    total_creditos = df["Credito_Abs"].sum() if "Credito_Abs" in df.columns else 0.0
-    total_debitos = df["Debito_Abs"].sum() if "Debito_Abs" in df.columns else 0.0
-    num_transacoes = len(df)
+    saldo_atual = resumo["saldo_atual"]
+    total_creditos = resumo["total_creditos"]
+    total_debitos = resumo["total_debitos"]
+    num_transacoes = resumo["num_transacoes"]
 
     page.add_text_box(
         visual_id="kpi_saldo",
@@ -765,19 +1037,20 @@ def criar_pagina_categoria(dashboard: Any, data_source: str, df: pd.DataFrame) -
     chart_height = 300
     chart_width = (CANVAS_WIDTH - 60) // 2
 
-    debitos_por_cat = (
-        df[df["Tipo"] == "Débito"].groupby("Categoria")["Debito_Abs"].sum()
-    )
-    creditos_por_cat = (
-        df[df["Tipo"] == "Crédito"].groupby("Categoria")["Credito_Abs"].sum()
-    )
+    # Uma única agregação por (Tipo, Categoria) serve despesas e receitas
+    por_tipo = df.groupby(["Tipo", "Categoria"], observed=True, sort=False)[
+        ["Debito_Abs", "Credito_Abs"]
+    ].sum()
+    tipos = por_tipo.index.get_level_values("Tipo")
+    debitos_por_cat = por_tipo.loc[tipos == "Débito", "Debito_Abs"].droplevel("Tipo")
+    creditos_por_cat = por_tipo.loc[tipos == "Crédito", "Credito_Abs"].droplevel("Tipo")
 
     cat_resumo_text = "Resumo por Categoria\n\n"
     cat_resumo_text += "DESPESAS:\n"
-    for cat, val in debitos_por_cat.sort_values(ascending=False).head(5).items():
+    for cat, val in debitos_por_cat.nlargest(5).items():
         cat_resumo_text += f"  {cat}: {_formatar_brl(val)}\n"
     cat_resumo_text += "\nRECEITAS:\n"
-    for cat, val in creditos_por_cat.sort_values(ascending=False).head(5).items():
+    for cat, val in creditos_por_cat.nlargest(5).items():
         cat_resumo_text += f"  {cat}: {_formatar_brl(val)}\n"
 
     page.add_text_box(
@@ -842,11 +1115,17 @@ def criar_pagina_categoria(dashboard: Any, data_source: str, df: pd.DataFrame) -
     logger.info("Page 'Por Categoria' created: 1 KPI, 2 donut charts, 1 table")
 
 
-def criar_pagina_tendencias(dashboard: Any, data_source: str, df: pd.DataFrame) -> None:
+def criar_pagina_tendencias(
+    dashboard: Any,
+    data_source: str,
+    df: pd.DataFrame,
+    resumo: dict[str, Any],
+    mensal: pd.DataFrame,
+) -> None:
     """Cria a página de Tendências e Métricas Avançadas."""
     page = dashboard.new_page(page_name="Tendências")
 
-    metricas = calcular_metricas_avancadas(df)
+    metricas = resumo["metricas"]
 
     tendencia = df["Tendencia"].iloc[-1] if "Tendencia" in df.columns else "N/A"
     tendencia_emoji = (
@@ -909,17 +1188,17 @@ def criar_pagina_tendencias(dashboard: Any, data_source: str, df: pd.DataFrame)
         background_color=CORES["white"],
     )
 
-    mensal = df.groupby("AnoMes").agg({"Valor": "sum"}).reset_index()
-    mensal["MoM_Growth"] = mensal["Valor"].pct_change() * 100
-
     mom_text = "Crescimento MoM (últimos 6 meses):\n\n"
-    for _, row in mensal.tail(6).iterrows():
-        growth = row["MoM_Growth"]
-        if pd.notna(growth):
-            sinal = "+" if growth >= 0 else ""
-            mom_text += f"{row['AnoMes']}: {sinal}{growth:.1f}%\n"
+    ultimos = mensal["MoM_Growth"].tail(6)
+    for anomes, growth in zip(
+        ultimos.index.to_numpy(),
+        ultimos.to_numpy(dtype=np.float64),
+    ):
+        if np.isnan(growth):
+            mom_text += f"{anomes}: N/A\n"
         else:
-            mom_text += f"{row['AnoMes']}: N/A\n"
+            sinal = "+" if growth >= 0 else ""
+            mom_text += f"{anomes}: {sinal}{growth:.1f}%\n"
 
     page.add_text_box(
         visual_id="kpi_mom_growth",
@@ -1015,11 +1294,18 @@ def gerar_dashboard(df: pd.DataFrame) -> None:
     from powerbpy import Dashboard
 
     # Preparar dados para o dashboard
-    df_dashboard = preparar_dados_dashboard(df)
+    df_dashboard, mensal = preparar_dados_dashboard_e_resumo_mensal(df)
 
     # Salvar CSV para o Power BI
     ARQUIVO_DASHBOARD_DATA.parent.mkdir(parents=True, exist_ok=True)
-    df_dashboard.to_csv(ARQUIVO_DASHBOARD_DATA, index=False)
+    # Ano/Mes cabem em int16; os valores seguem float64 porque float32
+    # perderia centavos em saldos altos
+    df_dashboard[["Ano", "Mes"]] = df_dashboard[["Ano", "Mes"]].astype(np.int16)
+    # O pandas já formata em blocos; o buffer de 1 MiB agrupa as escritas
+    with ARQUIVO_DASHBOARD_DATA.open(
+        "w", encoding="utf-8", newline="", buffering=TAMANHO_BUFFER_CSV
+    ) as arquivo:
+        df_dashboard.to_csv(arquivo, index=False, lineterminator="\n")
     logger.info(f"Dashboard data saved to: {ARQUIVO_DASHBOARD_DATA}")
 
     # Remover dashboard existente
@@ -1040,9 +1326,10 @@ def gerar_dashboard(df: pd.DataFrame) -> None:
     logger.info(f"Dataset '{data_source}' added to dashboard")
 
     # Criar páginas
-    criar_pagina_visao_geral(dashboard, data_source, df_dashboard)
+    resumo = calcular_resumo_dashboard(df_dashboard, mensal)
+    criar_pagina_visao_geral(dashboard, data_source, resumo)
     criar_pagina_categoria(dashboard, data_source, df_dashboard)
-    criar_pagina_tendencias(dashboard, data_source, df_dashboard)
+    criar_pagina_tendencias(dashboard, data_source, df_dashboard, resumo, mensal)
     criar_pagina_analise_mensal(dashboard, data_source)
     criar_pagina_detalhamento(dashboard, data_source)
 
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 import requests
 from dotenv import load_dotenv
 from loguru import logger
+from requests.adapters import HTTPAdapter
 
 load_dotenv()
 
@@ -50,10 +51,14 @@ class HabiticaFarmer:
         self.session = requests.Session()
         self._configure_session()
         self.url = f"{self.config.base_url}/tasks/{self.config.task_id}/score/up"
+        # The request never changes, so prepare it once and reuse it every cast
+        self._prepared = self.session.prepare_request(
+            requests.Request("POST", self.url)
+        )
         self._counter = 0
 
     def _configure_session(self) -> None:
-        """Set up the session headers."""
+        """Set up the session headers and keep-alive connection pool."""
         self.session.headers.update(
             {
                 "x-api-user": self.config.user_id,
@@ -62,6 +67,8 @@ class HabiticaFarmer:
                 "Content-Type": "application/json",
             }
         )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+        self.session.mount("https://", adapter)
 
     def run(self) -> None:
         """Start the main farming loop."""
@@ -82,7 +89,7 @@ class HabiticaFarmer:
     def _perform_single_cast(self) -> None:
         """Performs a single API request and handles the response/sleeping."""
         try:
-            response = self.session.post(self.url, timeout=10)
+            response = self.session.send(self._prepared, timeout=10)
             self._handle_response(response)
         except requests.RequestException as e:
             logger.error(f"Iteration {self._counter}: Connection/Request error: {e}")
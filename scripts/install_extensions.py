@@ -13,7 +13,7 @@ from loguru import logger
 
 # Lista de IDs das extensões do VS Code para instalar
 # https://hl2guide.github.io/Awesome-Visual-Studio-Code-Extensions/
-EXTENSIONS = [
+EXTENSIONS = (
     # Recommended Extensions
     "RoscoP.ActiveFileInStatusBar",  # Active File In StatusBar
     "formulahendry.auto-close-tag",  # Auto Close Tag
@@ -62,9 +62,8 @@ EXTENSIONS = [
     "davidhouchin.whitespace-plus",  # Whitespace+
     "sketchbuch.vsc-workspace-sidebar",  # Workspace Sidebar
     "stneveadomi.grepc",  # grepc: Regex Highlighting
-    "PedroAlves1122.vscode-minify",  # vscode-minify
+    "PedroAlves1122.vscode-minify",  # vscode-minify (Auto-Minify)
     # Specialized Extensions
-    "PedroAlves1122.vscode-minify",  # Auto-Minify
     "mark-wiemer.vscode-autohotkey-plus-plus",  # AutoHotkey Plus Plus
     "formulahendry.code-runner",  # Code Runner
     "nmsmith89.incrementor",  # Incrementor
@@ -75,14 +74,14 @@ EXTENSIONS = [
     "slevesque.shader",  # Shader languages support
     "koalamer.workspace-in-status-bar",  # Workspace Name in Status Bar
     "bmuskalla.vscode-tldr",  # tl;dr pages
-]
+)
 
 
 @dataclass
 class VSCodeExtensionManager:
     """Gerenciador de extensões do Visual Studio Code."""
 
-    extensions_to_install: list[str] = field(default_factory=lambda: EXTENSIONS.copy())
+    extensions_to_install: list[str] = field(default_factory=lambda: list(EXTENSIONS))
     _success_count: int = field(default=0, init=False)
     _fail_count: int = field(default=0, init=False)
     _failed_extensions: list[str] = field(default_factory=list, init=False)
@@ -203,21 +202,60 @@ class VSCodeExtensionManager:
 
         return False
 
-    def install_all(self) -> None:
-        """Instala todas as extensões da lista."""
-        self._reset_counters()
-        total = len(self.extensions_to_install)
+    def _install_batch(self, extension_ids: list[str]) -> list[str]:
+        """Instala várias extensões em uma única chamada do CLI do VS Code.
 
-        logger.info(f"Total de extensões para instalar: {total}")
+        Args:
+            extension_ids: Os identificadores das extensões no marketplace.
 
-        for i, extension in enumerate(self.extensions_to_install, 1):
-            logger.info(f"[{i}/{total}]")
+        Returns:
+            list[str]: Extensões que continuam ausentes após a chamada.
+        """
+        logger.info(f"Instalando {len(extension_ids)} extensões em lote...")
 
-            if self.install(extension):
-                self._success_count += 1
-            else:
-                self._fail_count += 1
-                self._failed_extensions.append(extension)
+        args = [arg for ext in extension_ids for arg in ("--install-extension", ext)]
+        try:
+            self._run_code_command(*args, "--force")
+        except Exception as e:
+            logger.exception(f"Exceção na instalação em lote: {e}")
+            return extension_ids
+
+        # A saída do lote não é estável entre versões; conferir a lista é mais seguro
+        instaladas = {ext.lower() for ext in self.list_installed() if ext}
+        return [ext for ext in extension_ids if ext.lower() not in instaladas]
+
+    def install_all(self) -> None:
+        """Instala as extensões que ainda faltam em lote, repetindo as falhas."""
+        self._reset_counters()
+
+        # IDs do marketplace não diferenciam maiúsculas de minúsculas
+        instaladas = {ext.lower() for ext in self.list_installed() if ext}
+        pendentes = [
+            ext for ext in self.extensions_to_install if ext.lower() not in instaladas
+        ]
+        if ignoradas := len(self.extensions_to_install) - len(pendentes):
+            logger.info(f"Extensões já instaladas (ignoradas): {ignoradas}")
+
+        logger.info(f"Total de extensões para instalar: {len(pendentes)}")
+
+        # Uma só inicialização do CLI para todas; só as falhas vão uma a uma
+        restantes = self._install_batch(pendentes) if pendentes else []
+        self._success_count = len(pendentes) - len(restantes)
+
+        if restantes:
+            total = len(restantes)
+            logger.info(f"Tentando individualmente: {total}")
+
+            # Em sequência: processos 'code' simultâneos disputam o mesmo
+            # diretório de extensões e corrompem as instalações uns dos outros
+            for i, extension in enumerate(restantes, 1):
+                logger.info(f"[{i}/{total}]")
+
+                if self.install(extension):
+                    self._success_count += 1
+                else:
+                    self._fail_count += 1
+                    self._failed_extensions.append(extension)
 
         self._log_summary("instaladas", "instalação")
 
@@ -4,8 +4,6 @@ import argparse
 import time
 from string import ascii_lowercase
 
-import keyboard
-
 
 def press_keys(keys: list[str], press_interval: int = 1) -> None:
     """Pressiona as teclas fornecidas em sequência.
@@ -17,11 +15,22 @@ def press_keys(keys: list[str], press_interval: int = 1) -> None:
     if not keys:
         raise ValueError("Keys list cannot be empty")
 
-    for key in keys:
-        if (key := key.lower()) not in ascii_lowercase:
+    # Cada tecla precisa ser uma única letra; validar antes de pressionar
+    # qualquer uma evita executar só parte da sequência
+    sequence = [key.lower() for key in keys]
+    for key in sequence:
+        if len(key) != 1 or key not in ascii_lowercase:
             raise ValueError(f"Key {key} is not a lowercase letter")
 
-        keyboard.press_and_release(key)
+    # Importado sob demanda: carregar o backend de teclado do sistema
+    # fica fora do caminho do --help e de argumentos inválidos
+    import keyboard
+
+    # press_and_release envia scan codes reais; keyboard.write injeta texto
+    # Unicode no Windows, que jogos e atalhos ignoram
+    press_and_release = keyboard.press_and_release
+    for key in sequence:
+        press_and_release(key)
         print(f"Pressed: {key}")
         time.sleep(press_interval)
 
@@ -35,11 +44,15 @@ def main(*, wait: int, keys: list[str]) -> None:
     """
     print("Starting key presser... Press Ctrl+C to stop")
 
+    next_run = time.monotonic()
     try:
         while True:
             press_keys(keys=keys)
-            print(f"Waiting {wait} seconds...")
-            time.sleep(wait)
+            # Prazo monotônico evita que o tempo gasto pressionando acumule atraso
+            next_run += wait
+            remaining = max(0.0, next_run - time.monotonic())
+            print(f"Waiting {remaining:.1f} seconds...")
+            time.sleep(remaining)
     except KeyboardInterrupt:
         print("\nStopped by user")
 
@@ -1,13 +1,10 @@
 import webbrowser
-from string import Template
 from time import perf_counter
 from urllib.parse import quote
 
 words = input("Enter the words to search (comma separated): ").split(",")
 
-TPL = Template(
-    "https://dicionario.reverso.net/ingles-definicao/${word}#translation=brazilian"
-)
+BASE_URL = "https://dicionario.reverso.net/ingles-definicao/"
 
 
 def normalize(token: str) -> str:
@@ -16,13 +13,12 @@ def normalize(token: str) -> str:
 
 def build_url(word: str) -> str:
     encoded = quote(word, safe="")
-    return TPL.substitute(word=encoded)
+    return f"{BASE_URL}{encoded}#translation=brazilian"
 
 
 def open_words(items: list[str]) -> None:
-    for token in items:
-        norm = normalize(token)
-        url = build_url(norm)
+    unique_words = [word for word in dict.fromkeys(map(normalize, items)) if word]
+    for url in map(build_url, unique_words):
         webbrowser.open(url, new=2)
 
 
@@ -1,9 +1,12 @@
 """Script para calcular o valor dos materiais do Tabernáculo em preços atuais."""
 
+import asyncio
+import json
+import time
 from dataclasses import dataclass
+from pathlib import Path
 
-import pandas as pd
-import yfinance as yf
+import aiohttp
 
 
 @dataclass
@@ -46,46 +49,106 @@ MATERIALS_DATA = [
 TALENT_TO_KG = 34.2  # 1 talent ≈ 34.2 kg
 SHEKEL_TO_KG = 0.0114  # 1 shekel ≈ 11.4 g
 
+# Cache local das cotações para evitar novas requisições em execuções seguidas
+PRICES_CACHE_FILE = Path(__file__).parents[1] / ".cache" / "tabernaculo_prices.json"
+PRICES_CACHE_TTL_SECONDS = 3600
 
-def main() -> None:
-    """Entry point for the script."""
-    pd.options.display.float_format = "{:,.2f}".format  # type: ignore[method-assign]
+CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{ticker}"
+HEADERS = {"User-Agent": "Mozilla/5.0"}
+REQUEST_TIMEOUT_SECONDS = 10
 
-    # Cria DataFrame a partir dos dados dos materiais
-    materials_df = pd.DataFrame([vars(m) for m in MATERIALS_DATA])
-    materials_df.set_index("name", inplace=True)
 
-    # Calcula o peso total em kg para cada material
-    materials_df["weight_kg"] = (
-        materials_df["talents"] * TALENT_TO_KG + materials_df["shekels"] * SHEKEL_TO_KG
-    )
+async def _fetch_price(session: aiohttp.ClientSession, ticker: str) -> float:
+    """Obtém o preço atual de um ticker na API de gráficos do Yahoo Finance.
 
-    # Obtém todos os tickers incluindo a taxa de câmbio BRL
-    tickers_list = materials_df["ticker"].tolist() + ["BRL=X"]
+    Args:
+        session (aiohttp.ClientSession): Sessão HTTP compartilhada.
+        ticker (str): Ticker do Yahoo Finance.
 
-    # Download de todos os preços em uma única requisição
-    prices_df = yf.download(
-        tickers=tickers_list, period="1d", progress=False, auto_adjust=True
-    )["Close"].iloc[0]
+    Returns:
+        float: Preço de mercado atual do ticker.
+    """
+    async with session.get(
+        CHART_URL.format(ticker=ticker), params={"interval": "1d", "range": "1d"}
+    ) as response:
+        response.raise_for_status()
+        data = await response.json()
+    return float(data["chart"]["result"][0]["meta"]["regularMarketPrice"])
 
-    # Extrai a taxa USD/BRL
-    usd_brl_rate = prices_df["BRL=X"]
 
-    # Calcula o preço por kg em USD para cada material
-    materials_df["price_usd_per_kg"] = materials_df.apply(
-        lambda row: prices_df[row["ticker"]] / row["unit_weight"], axis=1
-    )
+async def _fetch_prices(tickers: list[str]) -> dict[str, float]:
+    """Consulta todos os tickers simultaneamente em uma única sessão."""
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS)
+    async with aiohttp.ClientSession(headers=HEADERS, timeout=timeout) as session:
+        prices = await asyncio.gather(
+            *(_fetch_price(session, ticker) for ticker in tickers)
+        )
+    return dict(zip(tickers, prices))
+
+
+def fetch_prices(tickers: list[str]) -> dict[str, float]:
+    """Baixa o preço atual de cada ticker com requisições concorrentes.
+
+    Args:
+        tickers (list[str]): Tickers do Yahoo Finance.
+
+    Returns:
+        dict[str, float]: Preço atual por ticker.
+    """
+    return asyncio.run(_fetch_prices(tickers))
+
 
-    # Calcula o custo em USD e BRL para cada material
-    materials_df["cost_usd"] = (
-        materials_df["weight_kg"] * materials_df["price_usd_per_kg"]
+def load_prices(tickers: list[str]) -> dict[str, float]:
+    """Retorna as cotações do cache em disco ou as baixa se expiradas.
+
+    Args:
+        tickers (list[str]): Tickers do Yahoo Finance.
+
+    Returns:
+        dict[str, float]: Preço de fechamento por ticker.
+    """
+    try:
+        cached = json.loads(PRICES_CACHE_FILE.read_text(encoding="utf-8"))
+        is_fresh = time.time() - cached["timestamp"] < PRICES_CACHE_TTL_SECONDS
+        if is_fresh and set(tickers) <= cached["prices"].keys():
+            return {ticker: cached["prices"][ticker] for ticker in tickers}
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+
+    prices = fetch_prices(tickers)
+    PRICES_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    PRICES_CACHE_FILE.write_text(
+        json.dumps({"timestamp": time.time(), "prices": prices}), encoding="utf-8"
     )
-    materials_df["cost_brl"] = materials_df["cost_usd"] * usd_brl_rate
+    return prices
+
+
+def main() -> None:
+    """Entry point for the script."""
+    # Obtém todos os tickers incluindo a taxa de câmbio BRL
+    tickers_list = [m.ticker for m in MATERIALS_DATA] + ["BRL=X"]
 
-    # Exibe resultados
-    print(materials_df[["weight_kg", "cost_usd", "cost_brl"]])
-    print(f"\nTotal USD: ${materials_df['cost_usd'].sum():,.2f}")
-    print(f"Total BRL: R${materials_df['cost_brl'].sum():,.2f}")
+    # Preços do cache local ou de requisições concorrentes
+    prices = load_prices(tickers_list)
+
+    # Extrai a taxa USD/BRL
+    usd_brl_rate = prices["BRL=X"]
+
+    # Três materiais: contas diretas, sem montar um DataFrame
+    print(f"{'name':<8}{'weight_kg':>12}{'cost_usd':>18}{'cost_brl':>18}")
+    total_usd = 0.0
+    for material in MATERIALS_DATA:
+        weight_kg = material.talents * TALENT_TO_KG + material.shekels * SHEKEL_TO_KG
+        price_usd_per_kg = prices[material.ticker] / material.unit_weight
+        cost_usd = weight_kg * price_usd_per_kg
+        total_usd += cost_usd
+        print(
+            f"{material.name:<8}{weight_kg:>12,.2f}"
+            f"{cost_usd:>18,.2f}{cost_usd * usd_brl_rate:>18,.2f}"
+        )
+
+    print(f"\nTotal USD: ${total_usd:,.2f}")
+    print(f"Total BRL: R${total_usd * usd_brl_rate:,.2f}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,23 @@
+from scripts import anki_mathjax
+from scripts.anki_mathjax import replace_dollar_signs
+
+
+class TestReplaceDollarSigns:
+    def test_sem_cifrao_retorna_texto_intacto(self):
+        text = "sem fórmulas\n"
+        assert replace_dollar_signs(text) is text
+
+    def test_linha_unica_alterna_delimitadores(self):
+        assert replace_dollar_signs("$a$ e $b$") == r"\(a\) e \(b\)"
+
+    def test_quebra_final_preservada(self):
+        assert replace_dollar_signs("$x$;$y$\n") == "\\(x\\);\\(y\\)\n"
+        assert replace_dollar_signs("$x$\r\n") == "\\(x\\)\r\n"
+
+    def test_linha_do_arquivo_usa_caminho_por_split(self, monkeypatch):
+        monkeypatch.setattr(anki_mathjax, "_DOLLAR_OR_NEWLINE_RE", None)
+        assert replace_dollar_signs("$a$\n") == "\\(a\\)\n"
+
+    def test_varias_linhas_reiniciam_alternancia(self):
+        text = "$a$ $b\n$c$\n"
+        assert replace_dollar_signs(text) == "\\(a\\) \\(b\n\\(c\\)\n"
@@ -1,17 +1,24 @@
 import json
 import tempfile
+from datetime import datetime
 from pathlib import Path
 
 import pandas as pd
 import pytest
 
+import scripts.contas_congregacao as contas
 from scripts.contas_congregacao import (
     _fix_chart_aggregation,
     _formatar_brl,
+    _limpar_coluna_numerica,
     adicionar_moving_averages,
+    agrupar_linhas_quebradas,
     calcular_metricas_avancadas,
+    calcular_resumo_mensal,
     calcular_tendencia,
     categorizar_transacao,
+    categorizar_transacoes,
+    consolidar_extratos,
     detectar_anomalias,
     limpar_numero,
     preparar_dados_dashboard,
@@ -35,6 +42,172 @@ class TestLimparNumero:
         assert limpar_numero(float("nan")) == 0.0
 
 
+class TestLimparColunaNumerica:
+    def test_equivale_a_limpar_numero(self):
+        valores = ["1.234,56", "-1.000,00", "", "-", float("nan"), None, "abc"]
+        result = _limpar_coluna_numerica(pd.Series(valores, dtype=object))
+        assert result.tolist() == [limpar_numero(v) for v in valores]
+
+
+class TestAgruparLinhasQuebradas:
+    def test_concatena_historico_ignorando_palavras(self):
+        df = pd.DataFrame(
+            {
+                "Data": ["01/02/24", None, None, "02/02/24"],
+                "Historico": ["Transfe Pix", "Fulano", "Saldo Anterior", "Deposito"],
+            }
+        )
+        result = agrupar_linhas_quebradas(df)
+
+        assert result["Historico"].tolist() == ["Transfe Pix Fulano", "Deposito"]
+
+
+class TestConsolidarExtratos:
+    @pytest.fixture
+    def df_extrato(self):
+        return pd.DataFrame(
+            {
+                "Data": pd.to_datetime(["2024-01-15", "2024-01-15", "2024-01-10"]),
+                "Historico": ["Pagto Cobranca", "Deposito", "Deposito"],
+                "Documento": ["1", "2", "3"],
+                "Valor": [-200.0, 500.0, 100.0],
+                "Saldo": [0.0, 0.0, 1100.0],
+                "Arquivo_Origem": ["extrato.xls"] * 3,
+            }
+        )
+
+    def test_remove_duplicatas_entre_arquivos(self, df_extrato):
+        result = consolidar_extratos([df_extrato, df_extrato.copy()])
+        assert len(result) == 3
+
+    def test_une_origens_de_arquivos_diferentes(self, df_extrato):
+        outro = df_extrato.assign(Valor=df_extrato["Valor"] + 1)
+        outro["Arquivo_Origem"] = pd.Categorical(["outro.xls"] * len(outro))
+        result = consolidar_extratos([df_extrato, outro])
+        origem = result["Arquivo_Origem"]
+        assert isinstance(origem.dtype, pd.CategoricalDtype)
+        assert origem.value_counts().to_dict() == {"extrato.xls": 3, "outro.xls": 3}
+
+    def test_ordena_creditos_antes_de_debitos_no_mesmo_dia(self, df_extrato):
+        result = consolidar_extratos([df_extrato])
+        assert result["Valor"].tolist() == [100.0, 500.0, -200.0]
+        assert result["Saldo"].tolist() == [1100.0, 1600.0, 1400.0]
+
+
+class TestProcessarArquivoBradesco:
+    @staticmethod
+    def _salvar_xlsx(caminho: Path, linhas: list[list]) -> None:
+        openpyxl = pytest.importorskip("openpyxl")
+        workbook = openpyxl.Workbook()
+        planilha = workbook.active
+        for _ in range(contas.HEADER_ROW):
+            planilha.append(["Bradesco"])
+        for linha in linhas:
+            planilha.append(linha)
+        workbook.save(caminho)
+
+    def test_datas_reais_com_cabecalho_repetido(self, tmp_path):
+        cabecalho = ["Data", "Historico", "Docto.", "Credito", "Debito", "Saldo"]
+        arquivo = tmp_path / "Bradesco_01.xlsx"
+        self._salvar_xlsx(
+            arquivo,
+            [
+                cabecalho,
+                [datetime(2024, 1, 2), "Deposito", "1", "100,00", None, "100,00"],
+                cabecalho,
+                [datetime(2024, 1, 3), "Pagto", "2", None, "-50,00", "50,00"],
+            ],
+        )
+
+        result = contas.processar_arquivo_bradesco(arquivo)
+
+        assert result is not None
+        assert result["Valor"].tolist() == [100.0, -50.0]
+        assert result["Arquivo_Origem"].tolist() == [arquivo.name] * 2
+
+    def test_descarta_texto_fora_do_formato_de_data(self, tmp_path):
+        cabecalho = ["Data", "Historico", "Docto.", "Credito", "Debito", "Saldo"]
+        arquivo = tmp_path / "Bradesco_01.xlsx"
+        self._salvar_xlsx(
+            arquivo,
+            [
+                cabecalho,
+                [datetime(2024, 1, 2), "Deposito", "1", "100,00", None, "100,00"],
+                ["03/01/24", "Pagto", "2", None, "-50,00", "50,00"],
+                ["Total", "Resumo", None, "100,00", "-50,00", None],
+            ],
+        )
+
+        result = contas.processar_arquivo_bradesco(arquivo)
+
+        assert result is not None
+        assert result["Data"].tolist() == [
+            pd.Timestamp("2024-01-02"),
+            pd.Timestamp("2024-01-03"),
+        ]
+
+
+class TestProcessarArquivoComCache:
+    def test_reutiliza_resultado_de_arquivo_inalterado(self, tmp_path, monkeypatch):
+        arquivo = tmp_path / "Bradesco_01.xls"
+        arquivo.write_text("conteudo")
+        chamadas = []
+
+        def processar_falso(caminho):
+            chamadas.append(caminho)
+            return pd.DataFrame({"Valor": [1.0]})
+
+        monkeypatch.setattr(contas, "processar_arquivo_bradesco", processar_falso)
+
+        primeiro = contas.processar_arquivo_com_cache(arquivo)
+        segundo = contas.processar_arquivo_com_cache(arquivo)
+
+        assert len(chamadas) == 1
+        pd.testing.assert_frame_equal(primeiro, segundo)
+
+    def test_reprocessa_cache_corrompido(self, tmp_path, monkeypatch):
+        arquivo = tmp_path / "Bradesco_01.xls"
+        arquivo.write_text("conteudo")
+        chamadas = []
+
+        def processar_falso(caminho):
+            chamadas.append(caminho)
+            return pd.DataFrame({"Valor": [1.0]})
+
+        monkeypatch.setattr(contas, "processar_arquivo_bradesco", processar_falso)
+
+        contas.processar_arquivo_com_cache(arquivo)
+        cache = contas._caminho_cache(arquivo)
+        cache.write_bytes(cache.read_bytes()[:10])
+
+        result = contas.processar_arquivo_com_cache(arquivo)
+
+        assert len(chamadas) == 2
+        assert result["Valor"].tolist() == [1.0]
+        assert pd.read_pickle(cache)["Valor"].tolist() == [1.0]
+
+    def test_preserva_cache_de_arquivo_com_nome_parecido(self, tmp_path, monkeypatch):
+        arquivo = tmp_path / "Bradesco_01.xls"
+        arquivo.write_text("conteudo")
+        pasta_cache = tmp_path / contas.PASTA_CACHE
+        pasta_cache.mkdir()
+        outro = pasta_cache / "Bradesco_01.xls.bak.v1_1_1.pkl"
+        outro.write_bytes(b"")
+        antigo = pasta_cache / "Bradesco_01.xls.v1_1_1.pkl"
+        antigo.write_bytes(b"")
+
+        monkeypatch.setattr(
+            contas,
+            "processar_arquivo_bradesco",
+            lambda _: pd.DataFrame({"Valor": [1.0]}),
+        )
+        contas.processar_arquivo_com_cache(arquivo)
+
+        assert outro.exists()
+        assert not antigo.exists()
+        assert not list(pasta_cache.glob("*.tmp"))
+
+
 class TestFormatarBrl:
     def test_valor_positivo(self):
         assert _formatar_brl(1234.56) == "R$ 1.234,56"
@@ -77,6 +250,34 @@ class TestPrepararDadosDashboard:
         assert result.iloc[0]["Tipo"] == "Crédito"
         assert result.iloc[1]["Tipo"] == "Débito"
 
+    def test_colunas_categoricas(self, df_extrato):
+        result = preparar_dados_dashboard(df_extrato.iloc[::-1])
+
+        for coluna in ("AnoMes", "MesNome", "Tipo", "Categoria", "Tendencia"):
+            assert isinstance(result[coluna].dtype, pd.CategoricalDtype)
+        assert result["AnoMes"].cat.categories.tolist() == ["2024-01", "2024-02"]
+
+    def test_agrupa_por_mes_uma_unica_vez(self, df_extrato, monkeypatch):
+        chamadas = []
+        original = contas.calcular_resumo_mensal
+
+        def contar(df):
+            chamadas.append(df)
+            return original(df)
+
+        monkeypatch.setattr(contas, "calcular_resumo_mensal", contar)
+        result, mensal = contas.preparar_dados_dashboard_e_resumo_mensal(df_extrato)
+
+        assert len(chamadas) == 1
+        assert mensal.index.tolist() == ["2024-01", "2024-02"]
+        assert result["MA3_Saldo"].tolist() == [1000.0, 750.0]
+
+    def test_nao_altera_dataframe_original(self, df_extrato):
+        original = df_extrato.copy()
+        preparar_dados_dashboard(df_extrato)
+
+        pd.testing.assert_frame_equal(df_extrato, original)
+
     def test_adiciona_valores_absolutos(self, df_extrato):
         result = preparar_dados_dashboard(df_extrato)
 
@@ -137,6 +338,13 @@ class TestCategorizarTransacao:
     def test_outros(self):
         assert categorizar_transacao("Operação desconhecida") == "Outros"
 
+    def test_versao_vetorizada_equivale_a_escalar(self):
+        historicos = pd.Series(
+            ["Dep Din Atm", "transfe pix Fulano", "Ted Recebido", "Nada", None]
+        )
+        result = categorizar_transacoes(historicos)
+        assert result.tolist() == [categorizar_transacao(h) for h in historicos]
+
 
 class TestCalcularMetricasAvancadas:
     @pytest.fixture
@@ -169,6 +377,14 @@ class TestCalcularMetricasAvancadas:
         expected = total_creditos / total_debitos
         assert abs(metricas["income_expense_ratio"] - expected) < 0.01
 
+    def test_resumo_dashboard_reaproveita_totais(self, df_metricas):
+        resumo = contas.calcular_resumo_dashboard(df_metricas)
+
+        assert resumo["total_creditos"] == 2500.0
+        assert resumo["total_debitos"] == 900.0
+        assert resumo["saldo_atual"] == 1600.0
+        assert resumo["metricas"] == calcular_metricas_avancadas(df_metricas)
+
 
 class TestCalcularTendencia:
     def test_tendencia_alta(self):
@@ -208,6 +424,14 @@ class TestAdicionarMovingAverages:
         assert "MA3_Fluxo" in result.columns
         assert "Tendencia" in result.columns
 
+    def test_resumo_mensal(self, df_mensal):
+        mensal = calcular_resumo_mensal(df_mensal)
+
+        assert mensal.index.tolist() == ["2024-01", "2024-02", "2024-03", "2024-04"]
+        assert mensal["MA3_Saldo"].tolist() == [1000.0, 1100.0, 1200.0, 1400.0]
+        assert pd.isna(mensal["MoM_Growth"].iloc[0])
+        assert mensal["MoM_Growth"].iloc[1] == pytest.approx(100.0)
+
 
 class TestDetectarAnomalias:
     @pytest.fixture
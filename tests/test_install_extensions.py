@@ -0,0 +1,88 @@
+import subprocess
+
+import pytest
+
+from scripts.install_extensions import EXTENSIONS, VSCodeExtensionManager
+
+
+class TestExtensions:
+    def test_sem_duplicatas(self):
+        ids = [ext.lower() for ext in EXTENSIONS]
+        assert len(ids) == len(set(ids))
+
+
+class FakeCode:
+    """Simula o CLI 'code' mantendo o conjunto de extensões instaladas."""
+
+    def __init__(self, instaladas=(), quebradas=()):
+        self.instaladas = set(instaladas)
+        self.quebradas = set(quebradas)
+        self.chamadas = []
+
+    def __call__(self, *args):
+        self.chamadas.append(args)
+        if args == ("--list-extensions",):
+            stdout = "\n".join(sorted(self.instaladas))
+            return subprocess.CompletedProcess(args, 0, stdout, "")
+
+        pedidas = [
+            args[i + 1] for i, a in enumerate(args) if a == "--install-extension"
+        ]
+        falhou = False
+        for ext in pedidas:
+            if ext in self.quebradas:
+                falhou = True
+            else:
+                self.instaladas.add(ext)
+        return subprocess.CompletedProcess(args, int(falhou), "", "erro" * falhou)
+
+    def instalacoes(self):
+        return [c for c in self.chamadas if "--install-extension" in c]
+
+
+@pytest.fixture
+def criar_manager(monkeypatch):
+    monkeypatch.setattr(
+        VSCodeExtensionManager, "_check_vscode_installed", lambda self: None
+    )
+
+    def criar(extensoes, code):
+        manager = VSCodeExtensionManager(extensions_to_install=list(extensoes))
+        monkeypatch.setattr(manager, "_run_code_command", code)
+        return manager
+
+    return criar
+
+
+class TestInstallAll:
+    def test_ignora_extensoes_ja_instaladas(self, criar_manager):
+        code = FakeCode(instaladas={"ms-python.python"})
+        manager = criar_manager(["MS-Python.Python", "a.b"], code)
+
+        manager.install_all()
+
+        assert code.instalacoes() == [("--install-extension", "a.b", "--force")]
+        assert manager._success_count == 1
+        assert not manager.has_failures
+
+    def test_lote_bem_sucedido_conta_todas(self, criar_manager):
+        code = FakeCode()
+        manager = criar_manager(["a.b", "c.d", "e.f"], code)
+
+        manager.install_all()
+
+        assert len(code.instalacoes()) == 1
+        assert manager._success_count == 3
+        assert not manager.has_failures
+
+    def test_falha_no_lote_repete_individualmente(self, criar_manager):
+        code = FakeCode(quebradas={"c.d"})
+        manager = criar_manager(["a.b", "c.d"], code)
+
+        manager.install_all()
+
+        assert code.instalacoes()[1:] == [("--install-extension", "c.d", "--force")]
+        assert manager._success_count == 1
+        assert manager._fail_count == 1
+        assert manager._failed_extensions == ["c.d"]
+        assert manager.has_failures
@@ -0,0 +1,14 @@
+import pytest
+
+from scripts.key_presser import press_keys
+
+
+class TestPressKeys:
+    def test_lista_vazia(self):
+        with pytest.raises(ValueError, match="empty"):
+            press_keys([])
+
+    @pytest.mark.parametrize("keys", [["ab"], ["enter"], ["z", "1"]])
+    def test_rejeita_tecla_que_nao_e_uma_letra(self, keys):
+        with pytest.raises(ValueError, match="lowercase letter"):
+            press_keys(keys)
@@ -0,0 +1,27 @@
+import json
+import time
+
+import pytest
+
+from scripts import tabernaculo
+
+
+class TestLoadPrices:
+    @pytest.fixture
+    def cache(self, tmp_path, monkeypatch):
+        arquivo = tmp_path / "prices.json"
+        monkeypatch.setattr(tabernaculo, "PRICES_CACHE_FILE", arquivo)
+        monkeypatch.setattr(
+            tabernaculo, "fetch_prices", lambda t: dict.fromkeys(t, 1.0)
+        )
+        return arquivo
+
+    def test_usa_cache_valido(self, cache):
+        cache.write_text(json.dumps({"timestamp": time.time(), "prices": {"A": 2.0}}))
+        assert tabernaculo.load_prices(["A"]) == {"A": 2.0}
+
+    @pytest.mark.parametrize("prices", [[], "A", 3])
+    def test_rebaixa_se_prices_nao_for_objeto(self, cache, prices):
+        cache.write_text(json.dumps({"timestamp": time.time(), "prices": prices}))
+        assert tabernaculo.load_prices(["A"]) == {"A": 1.0}
+        assert json.loads(cache.read_text())["prices"] == {"A": 1.0}